@@ -1,12 +1,12 @@
-from pyplugin.base import (
-    Plugin,
+from pyplugin.base import Plugin, get_plugin_name
+from pyplugin.registry import (
     register,
     unregister,
     get_registered_plugin,
-    get_plugin_name,
     lookup_plugin,
     replace_registered_plugin,
     get_registered_plugins,
+    get_registry_version,
 )
 from pyplugin.group import PluginGroup
 from pyplugin.decorators import plugin, group
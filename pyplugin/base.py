@@ -1,161 +1,38 @@
 from __future__ import annotations
 
-import contextlib
 import dataclasses
 import inspect
+import sys
 import typing
 import copy
 import warnings
-from collections import OrderedDict
 
 from pyplugin.exceptions import *
-from pyplugin.utils import import_helper, void_args, empty, infer_return_type, ensure_a_list, make_safe_args
-from pyplugin.settings import Settings, _SETTINGS, with_flag, REGISTER_MODE
+from pyplugin.utils import void_args, empty, infer_return_type, ensure_a_list, make_safe_args
+from pyplugin.settings import Settings, _SETTINGS
+from pyplugin.registry import (
+    _PLUGIN_REGISTRY,
+    register,
+    unregister,
+    get_registered_plugin,
+    get_registry_version,
+    get_registered_plugins,
+    replace_registered_plugin,
+    get_aliases,
+    lookup_plugin,
+)
 
 
 _DELIMITER = "."
 
+# dataclass slots are only supported from python 3.10
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 # ------------------------------------------
 # TypeVars
 # ------------------------------------------
 _R = typing.TypeVar("_R")
 
-# ------------------------------------------
-# Plugin Registry
-# ------------------------------------------
-
-_PLUGIN_REGISTRY: OrderedDict[str, tuple[Plugin, dict]] = OrderedDict()
-
-
-def register(
-    plugin: PluginLike,
-    name: str = None,
-    conflict_strategy: typing.Literal["replace", "keep_existing", "error"] = "error",
-    transient: bool = False,
-    **kwargs,
-) -> Plugin:
-    """
-    Arguments:
-        plugin (PluginLike): The plugin to register
-        name (str): The name to register the plugin under if not the plugin's full name (default: the plugin's
-            full name)
-        conflict_strategy ("replace" | "keep_existing" | "error"): Handle the case that a different plugin is already
-            registered under the same name:
-
-                - "keep_existing": Ignore the incoming register request
-                - "replace": Unregister the existing plugin first (if it's not loaded).
-                - "error": raises PluginRegisterError
-
-        transient (bool): Calls to register under the same name will behave as if conflict_strategy == "replace".
-    Raises:
-        PluginRegisterError: If there was an error in registering the plugin (e.g. trying to replace an already loaded
-            plugin)
-    Returns:
-        Plugin: The newly registered plugin or the existing plugin if conflict_strategy is "keep_existing"
-    """
-    # TODO: evyn.machi: perhaps in the future we can have a register hook
-    if not isinstance(plugin, Plugin):
-        plugin = Plugin(plugin, anonymous=True)
-
-    if not name:
-        name = plugin.get_full_name()
-
-    if name in _PLUGIN_REGISTRY and not _PLUGIN_REGISTRY[name][1].get("transient", False):
-        if _PLUGIN_REGISTRY[name] is plugin:
-            return _PLUGIN_REGISTRY[name][0]
-
-        if conflict_strategy == "keep_existing":
-            return _PLUGIN_REGISTRY[name][0]
-        elif conflict_strategy == "replace":
-            unregister(name, conflict_strategy="error")
-        elif conflict_strategy == "error":
-            raise PluginRegisterError(f"Plugin with name {name} already registered.")
-
-    kwargs.update(transient=transient)
-    _PLUGIN_REGISTRY[name] = (plugin, kwargs)
-
-    return _PLUGIN_REGISTRY[name][0]
-
-
-def unregister(
-    plugin: typing.Union[str, Plugin],
-    conflict_strategy: typing.Literal["ignore", "error"] = "error",
-) -> typing.Optional[Plugin]:
-    """
-
-    Arguments:
-        plugin (Plugin | str): The plugin to unregister
-        conflict_strategy ("ignore" | "error"): Handle the case that the name is not registered.
-
-            - "ignore": Ignore the incoming unregister request
-            - "error": raises PluginRegisterError
-    Raises:
-        PluginRegisterError: If there was an error in unregistering the plugin
-    Returns:
-        Plugin | None: The unregistered plugin or None
-    """
-    name = plugin if isinstance(plugin, str) else plugin.get_full_name()
-
-    # TODO: evyn.machi: perhaps in the future we can have an unregister hook
-    if name not in _PLUGIN_REGISTRY:
-        if conflict_strategy == "ignore":
-            return None
-        elif conflict_strategy == "error":
-            raise PluginRegisterError(f"Plugin {name} is not registered")
-
-    if _PLUGIN_REGISTRY[name][0].is_loaded():
-        raise PluginRegisterError(f"Cannot unregister already loaded plugin {name}.")
-
-    return _PLUGIN_REGISTRY.pop(name)[0]
-
-
-def get_registered_plugin(name: str) -> Plugin:
-    """
-    Arguments:
-        name (str): The name of the plugin
-    Returns:
-        Plugin: The plugin registered with the given name
-    Raises:
-        PluginNotFoundError: If the plugin with the given name is not found
-    """
-    if name not in _PLUGIN_REGISTRY:
-        raise PluginNotFoundError(name)
-    return _PLUGIN_REGISTRY[name][0]
-
-
-def get_registered_plugins() -> OrderedDict[str, Plugin]:
-    """
-    Returns:
-        OrderedDict[str, Plugin]: A map from plugin name to plugin in the order which they were registered.
-    """
-    return OrderedDict({name: plugin for name, (plugin, _) in _PLUGIN_REGISTRY.items()})
-
-
-def replace_registered_plugin(name: str, plugin: PluginLike, **kwargs):
-    """
-    Will replace the registered plugin with the given name in-place with the given plugin.
-
-    See :meth:`~pyplugin.base.Plugin.replace_with`.
-
-    Arguments:
-        name (str): The plugin name to replace
-        plugin (PluginLike): The plugin to replace the curent plugin with
-        kwargs: See :meth:`~pyplugin.base.Plugin.replace_with`
-    """
-    registered_plugin = get_registered_plugin(name)
-    registered_plugin.replace_with(plugin, **kwargs)
-
-
-def get_aliases(plugin: Plugin) -> list[str]:
-    """
-    Arguments:
-        plugin (Plugin): The plugin to get aliases for
-    Returns:
-        list[str]: A list of names that this plugin is registered to.
-    """
-    return [name for name, (plugin_, _) in _PLUGIN_REGISTRY.items() if plugin_ is plugin]
-
-
 # ------------------------------------------
 # Plugin Misc Utils
 # ------------------------------------------
@@ -178,57 +55,43 @@ def get_plugin_name(plugin: PluginLike, name: str = empty) -> str:
     if name is not empty:
         return name
     if isinstance(plugin, Plugin):
-        return plugin.get_full_name()
+        return plugin._full_name
     if isinstance(plugin, str):
         return plugin
 
-    if hasattr(plugin, "__qualname__"):
-        name = plugin.__qualname__
-    elif hasattr(plugin, "__name__"):
-        name = plugin.__name__
-
-    module = inspect.getmodule(plugin)
-    if module:
-        name = _DELIMITER.join((module.__name__, name))
-
-    if name is empty or not name:
+    name = getattr(plugin, "__qualname__", None) or getattr(plugin, "__name__", None)
+    if not name:
         raise ValueError(f"Cannot resolve name for {plugin}")
+
+    # __module__ is what inspect.getmodule looks up first, only fall back to its slower search when it is missing
+    module_name = getattr(plugin, "__module__", None)
+    if not module_name:
+        module = inspect.getmodule(plugin)
+        module_name = module.__name__ if module else None
+    if module_name:
+        name = f"{module_name}{_DELIMITER}{name}"
     return name
 
 
-def lookup_plugin(name: str, import_lookup: bool = None) -> Plugin:
+def _matches_type(instance: typing.Any, type_: typing.Type, is_class_type: bool = False) -> bool:
     """
     Arguments:
-        name (str): The plugin name to lookup
-        import_lookup (bool): If True and :code:`name` is not registered, will attempt to import the name
-            and wrap in :class:`Plugin`.
+        instance (Any): The value to check
+        type_ (type): The type to check against
+        is_class_type (bool): If True, checks that :code:`instance` is a subclass of :code:`type_` rather than an
+            instance of it.
     Returns:
-        Plugin: The plugin with the registered name, falling back to an import lookup that wraps
+        bool: True if :code:`instance` matches :code:`type_`
     """
-    settings = Settings()
-    if import_lookup is None:
-        import_lookup = settings["import_lookup"]
-
-    try:
-        return get_registered_plugin(name)
-    except PluginNotFoundError:
-        if not import_lookup:
-            raise
-        with with_flag(REGISTER_MODE, "transient"):
-            plugin_like = import_helper(name)
-
-        if isinstance(plugin_like, Plugin):
-            return plugin_like
-
-        if not callable(plugin_like):
-            raise
-        return Plugin(import_helper(name), name=name)
+    if is_class_type:
+        return isinstance(instance, type) and issubclass(instance, type_)
+    return isinstance(instance, type_)
 
 
 # ------------------------------------------
 # Plugin Requirements / Dependencies
 # ------------------------------------------
-@dataclasses.dataclass
+@dataclasses.dataclass(**_DATACLASS_SLOTS)
 class PluginRequirement:
     """
 
@@ -236,33 +99,38 @@ class PluginRequirement:
         plugin (Plugin | str): The plugin dependency, if this is a string, will perform a :func:`lookup_plugin` before
             loading.
         dest (str): The keyword name to call :meth:`Plugin.load` with.
+        lazy (bool): If True, the plugin itself is passed under :attr:`dest` instead of its loaded instance, and it is
+            only loaded once called. (default: False)
 
     """
 
     plugin: typing.Union[Plugin, str]
     dest: str
+    lazy: bool = False
+
+    def __post_init__(self):
+        self.dest = sys.intern(self.dest)
 
     @classmethod
     def from_tuple(cls, value):
         return PluginRequirement(*value)
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, PluginRequirement):
             return False
 
-        if self.dest != other.dest:
+        if self.dest != other.dest or self.lazy != other.lazy:
             return False
 
-        if isinstance(self.plugin, type(other.plugin)):
+        if type(self.plugin) is type(other.plugin):
             return self.plugin == other.plugin
 
-        try:
-            plugin1 = self.plugin if isinstance(self.plugin, Plugin) else get_registered_plugin(self.plugin)
-            plugin2 = other.plugin if isinstance(other.plugin, Plugin) else get_registered_plugin(other.plugin)
-        except PluginNotFoundError:
-            return False
-
-        return plugin1 == plugin2
+        # a name and a plugin are equal if the name is registered to that plugin
+        plugin1 = self.plugin if isinstance(self.plugin, Plugin) else _PLUGIN_REGISTRY.get(self.plugin, (None,))[0]
+        plugin2 = other.plugin if isinstance(other.plugin, Plugin) else _PLUGIN_REGISTRY.get(other.plugin, (None,))[0]
+        return plugin1 is not None and plugin1 == plugin2
 
 
 class Plugin(typing.Generic[_R]):
@@ -293,12 +161,13 @@ class Plugin(typing.Generic[_R]):
 
         requirements (dict[str, PluginRequirement]): The dependencies this plugin requires before loading.
             Requirements will be passed via keyword argument using the :attr:`PluginRequirement.dest` name.
-        dependencies (OrderedDict[str, Plugin]): A map from :attr:`PluginRequirement.dest` to the resolved plugin.
-            This map is populated upon loading along with the corresponding :attr:`dependents` list of the
+        dependencies (dict[str, Plugin]): A map from :attr:`PluginRequirement.dest` to the resolved plugin.
+            This map is populated upon loading along with the corresponding :attr:`dependents` map of the
             required Plugin.
-        dependents (list[Plugin]): A list of Plugins that depend on this Plugin. This list is populated when
-            the dependent Plugin is loaded and the dependent Plugin is guaranteed to have this Plugin in
-            its :attr:`dependencies` map.
+        dependents (dict[Plugin, str]): A map from the Plugins that depend on this Plugin to the
+            :attr:`PluginRequirement.dest` they receive this Plugin under. This map is populated when the dependent
+            Plugin is loaded and the dependent Plugin is guaranteed to have this Plugin in its :attr:`dependencies`
+            map under that dest.
         callbacks (Iterable[typing.Callable[[_R], _R]]): Functions that will be called in order that modify the
             loaded plugin instance after loading.
 
@@ -324,12 +193,38 @@ class Plugin(typing.Generic[_R]):
             (default: False)
 
         requires (PluginLike | PluginRequirement | tuple[PluginLike, str] | Iterable[...]): Any plugin dependencies to
-            load beforehand.
+            load beforehand. See :class:`PluginRequirement` for deferring the load of a dependency until it is used.
         callbacks (Iterable[typing.Callable[[_R], _R]]): Functions that will be called in order that modify the
             loaded plugin instance after loading.
 
     """
 
+    __slots__ = (
+        "_settings",
+        "_full_name",
+        "_namespace",
+        "_name",
+        "_kwargs",
+        "infer_type",
+        "type",
+        "is_class_type",
+        "enforce_type",
+        "load_args",
+        "load_kwargs",
+        "_partially_loaded",
+        "instance",
+        "_original_callable",
+        "_original_unload_callable",
+        "_load_callable",
+        "_unload_callable",
+        "requirements",
+        "dependencies",
+        "dependents",
+        "_populated_version",
+        "callbacks",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         plugin: typing.Callable[..., _R],
@@ -347,6 +242,7 @@ class Plugin(typing.Generic[_R]):
         requires = ensure_a_list(requires)
 
         self._full_name = None
+        self._namespace = None
         self._name = None
         self.full_name = get_plugin_name(plugin, name=name)
 
@@ -359,28 +255,30 @@ class Plugin(typing.Generic[_R]):
 
         self.load_args = None
         self.load_kwargs = None
-        self.__partially_loaded = False
+        self._partially_loaded = False
         self.instance: _R = empty
 
         self._init_callables(plugin, unload_callable, bind=bind)
 
         self.requirements = {}
-        self.dependencies = OrderedDict()
-        self.dependents = []
+        self.dependencies = {}
+        self.dependents = {}
+        self._populated_version = None
         self.callbacks = list(callbacks)
 
+        # not loaded yet, so skip the loaded check in add_requirement
         for requirement in requires:
-            self.add_requirement(requirement)
+            self._add_requirement(requirement)
 
         if not kwargs.get("anonymous", False):
             if self._settings["register_mode"] == "eager":
-                register(self, name=self.full_name, conflict_strategy="error")
+                register(self, name=self._full_name, conflict_strategy="error")
             elif self._settings["register_mode"] == "replace":
-                register(self, name=self.full_name, conflict_strategy="replace")
+                register(self, name=self._full_name, conflict_strategy="replace")
             elif self._settings["register_mode"] == "transient":
-                register(self, name=self.full_name, conflict_strategy="error", transient=True)
+                register(self, name=self._full_name, conflict_strategy="error", transient=True)
             elif self._settings["register_mode"] == "replace+transient":
-                register(self, name=self.full_name, conflict_strategy="replace", transient=True)
+                register(self, name=self._full_name, conflict_strategy="replace", transient=True)
 
     def _init_callables(
         self,
@@ -390,8 +288,8 @@ class Plugin(typing.Generic[_R]):
     ):
         self.load_args = None
         self.load_kwargs = None
-        self.__original_callable = self._load_callable = load_callable
-        self.__original_unload_callable = self._unload_callable = unload_callable
+        self._original_callable = self._load_callable = load_callable
+        self._original_unload_callable = self._unload_callable = unload_callable
 
         if not self.type and self.infer_type:
             self._set_type()
@@ -401,42 +299,45 @@ class Plugin(typing.Generic[_R]):
             self._unload_callable = self._unload_callable.__get__(self, type(self))
 
     def __repr__(self) -> str:
-        attrs = ", ".join(
-            (
-                repr(self.__original_callable),
-                f"name='{self.get_full_name()}'",
-                f"unload_callable={repr(self.__original_unload_callable)}",
-            )
+        return (
+            f"{self.__class__.__name__}({self._original_callable!r}, name='{self.get_full_name()}', "
+            f"unload_callable={self._original_unload_callable!r})"
         )
-        return f"{self.__class__.__name__}(" + attrs + ")"
 
     def __copy__(self) -> Plugin:
-        kwargs = self._kwargs.copy()
-        kwargs.update(
-            anonymous=True,
-        )
-
-        ret = Plugin(
-            self.__original_callable,
-            unload_callable=self.__original_unload_callable,
-            name=self.name,
-            type=self.type,
-            requires=list(self.requirements.copy().values()),
-            callbacks=list(self.callbacks),
-            **kwargs,
-        )
+        # clone directly rather than through __init__ to skip name resolution, type inference and registration. Every
+        # slot starts out as this plugin's value so none are left unset, then anything per-plugin is replaced below.
+        ret = object.__new__(Plugin)
+        for slot in Plugin.__slots__:
+            if slot != "__weakref__" and hasattr(self, slot):
+                setattr(ret, slot, getattr(self, slot))
+
+        ret._settings = copy.copy(self._settings)
+        ret._full_name, ret._namespace, ret._name = self._name, "", self._name
+        ret._kwargs = {**self._kwargs, "type": self.type, "anonymous": True}
+
+        ret._partially_loaded = False
+        ret.instance = empty
+
+        ret._init_callables(self._original_callable, self._original_unload_callable, bind=self._kwargs["bind"])
+
+        ret.requirements = dict(self.requirements)
+        ret.dependencies = {}
+        ret.dependents = {}
+        ret._populated_version = None
+        ret.callbacks = list(self.callbacks)
         return ret
 
     def __call__(self, *args, **kwargs) -> _R:
         """Alias for :meth:`load`"""
         return self.load(*args, **kwargs)
 
-    def __hash__(self) -> int:
-        return hash(self.get_full_name())
+    __hash__ = object.__hash__
 
     def _set_full_name(self, value):
-        self._full_name = value
-        self._name = self._full_name.split(_DELIMITER)[-1]
+        self._full_name = sys.intern(value)
+        namespace, _, name = self._full_name.rpartition(_DELIMITER)
+        self._namespace, self._name = sys.intern(namespace), sys.intern(name)
 
     def get_full_name(self) -> str:
         """
@@ -448,10 +349,8 @@ class Plugin(typing.Generic[_R]):
     full_name: str = property(get_full_name, _set_full_name)
 
     def _set_name(self, value):
-        self._name = value
-
-        parts = self._full_name.split(_DELIMITER)
-        self._full_name = _DELIMITER.join((*parts[:-1], self._name))
+        self._name = sys.intern(value)
+        self._full_name = sys.intern(f"{self._namespace}{_DELIMITER}{self._name}") if self._namespace else self._name
 
     def get_name(self) -> str:
         return self._name
@@ -533,14 +432,15 @@ class Plugin(typing.Generic[_R]):
             PluginRequirementError: If there was an issue registering the requirement
         """
 
-        if isinstance(requirement, PluginRequirement):
+        # Plugins first, dynamic requirements add one on every load made from within another plugin's load
+        if isinstance(requirement, Plugin):
+            requirement = PluginRequirement(requirement, dest=requirement.name)
+        elif isinstance(requirement, str):
+            requirement = PluginRequirement(requirement, dest=requirement.rpartition(_DELIMITER)[2])
+        elif isinstance(requirement, PluginRequirement):
             pass
         elif isinstance(requirement, tuple):
             requirement = PluginRequirement.from_tuple(requirement)
-        elif isinstance(requirement, str):
-            requirement = PluginRequirement(requirement, dest=requirement.split(_DELIMITER)[-1])
-        elif isinstance(requirement, Plugin):
-            requirement = PluginRequirement(requirement, dest=requirement.name)
         else:
             plugin = Plugin(requirement)
             requirement = PluginRequirement(plugin, dest=plugin.name)
@@ -554,6 +454,7 @@ class Plugin(typing.Generic[_R]):
                 raise PluginRequirementError(f"Plugin requirement with dest {requirement.dest} already registered")
 
         self.requirements[requirement.dest] = requirement
+        self._invalidate_dependencies()
 
         return self.requirements[requirement.dest]
 
@@ -601,72 +502,170 @@ class Plugin(typing.Generic[_R]):
                 raise DependencyError(f"Dependency with dest {dest} already exists")
 
         self.dependencies[dest] = dependency
-        if self not in dependency.dependents:
-            dependency.dependents.append(self)
+        dependency.dependents[self] = dest
 
         return self.dependencies[dest]
 
-    def _populate_dependencies(self, seen=None):
-        seen = seen if seen else []
-        self.dependencies = OrderedDict()
-
-        if self in seen:
-            raise CircularDependencyError(
-                " --> ".join((*(plugin.get_full_name() for plugin in seen), self.get_full_name()))
-            )
+    def _invalidate_dependencies(self):
+        # this plugin and everything that depends on it must walk their requirements again on the next load
+        seen = set()
+        stack = [self]
+        while stack:
+            plugin = stack.pop()
+            if plugin in seen:
+                continue
+            seen.add(plugin)
+            plugin._populated_version = None
+            stack.extend(plugin.dependents)
+
+    def _populate_dependencies(self):
+        # Iterative depth-first walk of the requirement graph. path is the current requirement path, a dict so that it
+        # is ordered with O(1) membership. Plugins populated under the current registry version whose requirements (and
+        # their dependencies' requirements) have not changed since are not walked again, this also makes sure shared
+        # dependencies are only resolved once and that the nested loads of dependencies do not walk the graph again.
+        path = {}
+        version = get_registry_version()
+        stack = []
+
+        def visit(plugin):
+            if plugin in path:
+                raise CircularDependencyError(
+                    " --> ".join((*(other.get_full_name() for other in path), plugin.get_full_name()))
+                )
+            if plugin._populated_version == version:
+                return
+            plugin.dependencies = {}
+            plugin._populated_version = None
+            path[plugin] = None
+            stack.append((plugin, iter(plugin.requirements.values())))
+
+        visit(self)
+        while stack:
+            plugin, requirements = stack[-1]
+            requirement = next(requirements, None)
+            if requirement is None:
+                stack.pop()
+                del path[plugin]
+                plugin._populated_version = version
+                continue
 
-        for requirement in self.requirements.values():
-            plugin = (
-                lookup_plugin(requirement.plugin, import_lookup=self._settings["import_lookup"])
+            dependency = (
+                lookup_plugin(requirement.plugin, import_lookup=plugin._settings.import_lookup)
                 if isinstance(requirement.plugin, str)
                 else requirement.plugin
             )
-            plugin._populate_dependencies(seen=seen + [self])
-
-            self._populate_one_dependency(plugin, dest=requirement.dest, conflict_strategy="replace")
+            plugin._populate_one_dependency(dependency, dest=requirement.dest, conflict_strategy="replace")
+            visit(dependency)
 
     def _load_dependencies(self, kwargs):
         ret = {}
-        for dest, plugin in self.dependencies.copy().items():
+        for dest, plugin in tuple(self.dependencies.items()):
             if dest in kwargs:
                 continue
-            ret[dest] = plugin.load(conflict_strategy="keep_existing")
+            ret[dest] = self._load_dependency(dest, plugin)
         return ret
 
+    def _load_dependency(self, dest, plugin):
+        requirement = self.requirements.get(dest)
+        if requirement is not None and requirement.lazy:
+            return plugin
+        return plugin.load(conflict_strategy="keep_existing")
+
+    def _dependencies_loaded(self) -> bool:
+        """
+        Returns:
+            bool: True if every dependency that loading this plugin would load, transitively, is loaded.
+        """
+        seen = {self}
+        stack = [self]
+        while stack:
+            plugin = stack.pop()
+            for dest, dependency in plugin.dependencies.items():
+                if dependency in seen:
+                    continue
+                requirement = plugin.requirements.get(dest)
+                if requirement is not None and requirement.lazy:
+                    continue
+                if not dependency.is_loaded():
+                    return False
+                seen.add(dependency)
+                stack.append(dependency)
+        return True
+
     def _load_dependents(self, dependents=None):
         if dependents is None:
             dependents = self.dependents
 
-        for dependent in dependents.copy():
-            for dest, plugin in dependent.dependencies.items():
-                if plugin is self:
-                    dependent.load(conflict_strategy="force")
-                    return
-            raise InconsistentDependencyError(
-                f"Did not find {self.get_full_name()} in dependencies of dependent plugin {dependent.get_full_name()}"
-            )
-        return
+        dependents = list(dependents)
+        # a dependent of another plugin in the list is reloaded along with it, even if it also depends on this plugin
+        reloaded_with_other = {dependent for other in dependents for dependent in other.dependents}
 
-    def _unload_dependents(self, dependents=None):
-        if dependents is None:
-            dependents = self.dependents
+        for dependent in dependents:
+            if dependent not in self.dependents or dependent in reloaded_with_other:
+                # a transitive dependent, which may already be reloaded through its own dependencies
+                dependent.load(conflict_strategy="keep_existing")
+                continue
 
-        for dependent in dependents.copy():
-            dependent.unload(conflict_strategy="ignore")
+            if dependent.dependencies.get(self.dependents[dependent]) is not self:
+                raise InconsistentDependencyError(
+                    f"Did not find {self.get_full_name()} in dependencies of dependent plugin "
+                    f"{dependent.get_full_name()}"
+                )
+            dependent.load(conflict_strategy="force")
+
+    def _get_loaded_dependents(self) -> list[Plugin]:
+        """
+        Returns:
+            list[Plugin]: Every loaded plugin that transitively depends on this plugin, where each plugin comes after
+            the plugins it depends on.
+        """
+        if not self.dependents:
+            return []
+
+        order = []
+        seen = {self}
+        stack = [(self, iter(self.dependents))]
+        while stack:
+            plugin, dependents = stack[-1]
+            for dependent in dependents:
+                if dependent not in seen and dependent.is_loaded():
+                    seen.add(dependent)
+                    stack.append((dependent, iter(dependent.dependents)))
+                    break
+            else:
+                stack.pop()
+                if plugin is not self:
+                    order.append(plugin)
+
+        order.reverse()
+        return order
+
+    def _unload_dependents(self):
+        # deepest dependents first, so each plugin is unloaded before anything it depends on, without recursing
+        # through unload for every level of the graph
+        for dependent in reversed(self._get_loaded_dependents()):
+            dependent._unload(conflict_strategy="ignore", _unload_dependents=False)
 
     def _handle_dynamic_requirements(self):
         """
         Check if we were called inside another plugin's load function, if so, this is a dynamic requirement
         and we will treat the calling plugin the same way as any dependency
         """
-        for captured_frame in inspect.stack():
-            f_locals = captured_frame.frame.f_locals
-            if captured_frame.function == "load" and "self" in f_locals and isinstance(f_locals["self"], Plugin):
+        # walk the raw frames, inspect.stack() would also build a FrameInfo with source context for every frame
+        frame = sys._getframe(1)
+        while frame is not None:
+            if frame.f_code.co_name != "load":
+                frame = frame.f_back
+                continue
+
+            f_locals = frame.f_locals
+            frame = frame.f_back
+            if "self" in f_locals and isinstance(f_locals["self"], Plugin):
                 if f_locals["self"] is self:
                     continue
 
                 # Ensure we are called only in the _load_callable (as opposed to in load_dependents)
-                if not f_locals["self"].__partially_loaded:
+                if not f_locals["self"]._partially_loaded:
                     return
 
                 found = False
@@ -687,15 +686,15 @@ class Plugin(typing.Generic[_R]):
         return
 
     def _handle_enforce_type(self, instance, type_=None, is_class_type=None):
+        # off by default, so bail before resolving anything
+        if not self.enforce_type:
+            return
+
         type_ = type_ if type_ else self.type
         is_class_type = is_class_type if is_class_type else self.is_class_type
 
-        if self.enforce_type and type_:
-            if is_class_type:
-                comparator = issubclass
-            else:
-                comparator = isinstance
-            if not comparator(instance, type_):
+        if type_:
+            if not _matches_type(instance, type_, is_class_type):
                 raise PluginTypeError(
                     f"{self.get_full_name()}: Mismatched type, " f"expected {type_} but got {type(instance)}"
                 )
@@ -713,7 +712,7 @@ class Plugin(typing.Generic[_R]):
         of dependencies and dependents before and after, as well as type checking. In order:
 
         1. Requirements are resolved and used to populate the dependencies map, in addition to populating each
-           dependency's dependents list. If dynamic requirements are enabled, that will also be handled.
+           dependency's dependents map. If dynamic requirements are enabled, that will also be handled.
         2. Dependencies are loaded if the argument is not passed.
         3. Check if this plugin is already loaded based on previous load args and resolve the conflict if any.
         4. Call the underlying callable and call any callbacks in order, do type checking if enabled.
@@ -741,15 +740,17 @@ class Plugin(typing.Generic[_R]):
                 does not match :attr:`type`.
             PluginLoadError: If there was an error in loading dependencies or dependents
         """
-        args = list(args)
-
         # check cyclic load
-        if self.__partially_loaded:
+        if self._partially_loaded:
             raise PluginPartiallyLoadedError(self.get_full_name())
 
-        if self._settings["dynamic_requirements"]:
+        if self._settings.dynamic_requirements:
             self._handle_dynamic_requirements()
 
+        # nothing left to resolve, unless a dependency was unloaded without its dependents (e.g. by a group)
+        if conflict_strategy == "keep_existing" and self.is_loaded() and self._dependencies_loaded():
+            return self.instance
+
         try:
             self._populate_dependencies()
         except CircularDependencyError:
@@ -757,8 +758,6 @@ class Plugin(typing.Generic[_R]):
         except PluginError as err:
             raise PluginLoadError(f"{self.get_full_name()}: Could not resolve dependencies") from err
 
-        loaded_dependents = [plugin for plugin in self.dependents if plugin.is_loaded()]
-
         try:
             dep_kwargs = self._load_dependencies(kwargs)
         except PluginError as err:
@@ -767,8 +766,7 @@ class Plugin(typing.Generic[_R]):
         # set defaults from previous load settings
         default_kwargs = dep_kwargs
         if default_previous_args and self.load_kwargs:
-            for key, value in self.load_kwargs.items():
-                default_kwargs.setdefault(key, value)
+            default_kwargs = {**self.load_kwargs, **dep_kwargs}
 
         default_args, default_kwargs = make_safe_args(
             self._load_callable,
@@ -779,39 +777,44 @@ class Plugin(typing.Generic[_R]):
         )
 
         # construct args, kwargs merging with defaults
-        args = args + list(default_args[len(args) :])
-        for key, value in default_kwargs.items():
-            kwargs.setdefault(key, value)
+        args = (*args, *default_args[len(args) :])
+        kwargs = {**default_kwargs, **kwargs}
 
         # optionally, make the calling arguments safe
         if safe_args:
             args, kwargs = make_safe_args(self._load_callable, args, kwargs)
 
         # check load conflicts
-        if self.is_loaded():
+        is_loaded = self.is_loaded()
+        if is_loaded:
             if (self.load_args, self.load_kwargs) == (
                 args,
                 kwargs,
             ) and conflict_strategy != "force":
                 return self.instance
-            elif conflict_strategy in ("replace", "force"):
-                self.unload()
-            elif conflict_strategy == "keep_existing":
-                return self.instance
-            else:
+            elif conflict_strategy not in ("replace", "force"):
                 raise PluginAlreadyLoadedError(
                     f"{self.get_full_name()}: "
                     "Already loaded with conflicting arguments, "
                     f"old: {(self.load_args, self.load_kwargs)}, new: {(args, kwargs)}"
                 )
 
+        # only needed once we know we are (re)loading
+        loaded_dependents = self._get_loaded_dependents()
+        if is_loaded:
+            self.unload()
+
         self.load_args = args
         self.load_kwargs = kwargs
 
-        with self._partial_load_context():
+        # cyclic loads were checked on entry
+        self._partially_loaded = True
+        try:
             instance = self._load_callable(*args, **kwargs)
             for callback in self.callbacks:
                 instance = callback(instance)
+        finally:
+            self._partially_loaded = False
 
         self._handle_enforce_type(instance)
 
@@ -858,7 +861,7 @@ class Plugin(typing.Generic[_R]):
                 raise PluginAlreadyUnloadedError(self.get_full_name())
 
         # check cyclic load
-        if self.__partially_loaded:
+        if self._partially_loaded:
             raise PluginPartiallyLoadedError(self.get_full_name())
 
         if _unload_dependents:
@@ -867,8 +870,11 @@ class Plugin(typing.Generic[_R]):
             except PluginError as err:
                 raise PluginUnloadError(f"{self.get_full_name()}: Error in unloading dependents") from err
 
-        with self._partial_load_context():
+        self._partially_loaded = True
+        try:
             ret = self._unload_callable(self.instance)
+        finally:
+            self._partially_loaded = False
 
         self.instance = empty
 
@@ -905,28 +911,17 @@ class Plugin(typing.Generic[_R]):
         if plugin.instance is not empty:
             return self._set_type_from_instance(plugin.instance)
 
-        if not isinstance(plugin.__original_callable, str):
-            self.type = infer_return_type(plugin.__original_callable)
+        if not isinstance(plugin._original_callable, str):
+            self.type = infer_return_type(plugin._original_callable)
 
         return None
 
     def _set_type_from_instance(self, instance):
-        self.type = type(instance)
-        if inspect.isclass(self.type) and issubclass(self.type, type):
+        if isinstance(instance, type):
             self.type = instance
             self.is_class_type = True
-
-    @contextlib.contextmanager
-    def _partial_load_context(self):
-        if self.__partially_loaded:
-            raise PluginPartiallyLoadedError(self.get_full_name())
-
-        self.__partially_loaded = True
-
-        try:
-            yield
-        finally:
-            self.__partially_loaded = False
+        else:
+            self.type = type(instance)
 
     def replace_with(
         self,
@@ -951,25 +946,39 @@ class Plugin(typing.Generic[_R]):
 
         if isinstance(plugin, Plugin):
             if unload_callable:
-                warnings.warn("Argument unload_callable ignored as argument plugin is of type Plugin")
+                warnings.warn("Argument unload_callable ignored as argument plugin is of type Plugin", stacklevel=2)
 
-            load_callable = plugin.__original_callable
-            unload_callable = plugin.__original_unload_callable
+            load_callable = plugin._original_callable
+            unload_callable = plugin._original_unload_callable
             bind = plugin._kwargs["bind"]
-            load = self.is_loaded()
-            loaded_dependents = [dependent for dependent in self.dependents if dependent.is_loaded()]
+        else:
+            load_callable = plugin
+            unload_callable = unload_callable if unload_callable is not None else void_args
+
+        unchanged = (
+            load_callable is self._original_callable
+            and unload_callable is self._original_unload_callable
+            and bind == self._kwargs["bind"]
+        )
 
-            self.unload(conflict_strategy="ignore")
+        if isinstance(plugin, Plugin):
+            if not unchanged:
+                load = self.is_loaded()
+                if load:
+                    loaded_dependents = self._get_loaded_dependents()
+                    self.unload(conflict_strategy="ignore")
 
             if replace_type:
                 self.type = plugin.type
                 self.is_class_type = plugin.is_class_type
                 self.infer_type = plugin.infer_type
-        else:
-            load_callable = plugin
-            unload_callable = unload_callable if unload_callable else void_args
+
+        # the same callables, skip the unload and reload round-trip
+        if unchanged:
+            return
 
         self._init_callables(load_callable, unload_callable, bind=bind)
+        self._kwargs["bind"] = bind
 
         if load:
             self.load(conflict_strategy="error")
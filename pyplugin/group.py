@@ -1,9 +1,11 @@
 from __future__ import annotations
 import functools
+import heapq
 import typing
 from collections.abc import MutableSequence
 
-from pyplugin.base import Plugin, _R, get_registered_plugin, lookup_plugin, get_aliases
+from pyplugin.base import Plugin, _R
+from pyplugin.registry import _PLUGIN_REGISTRY, get_registered_plugin, lookup_plugin, get_aliases
 from pyplugin.utils import void_args, empty
 from pyplugin.exceptions import (
     PluginNotFoundError,
@@ -13,6 +15,51 @@ from pyplugin.exceptions import (
 )
 
 
+def _load_order(plugins: typing.Sequence[Plugin]) -> list[int]:
+    """
+    Orders the given plugins with Kahn's algorithm so that a plugin required by another in the sequence is loaded
+    first, otherwise keeping the given order. Plugins in a cycle are left in the given order to error on load.
+
+    Arguments:
+        plugins (Sequence[Plugin]): The plugins to order
+    Returns:
+        list[int]: The indices into :code:`plugins` in load order
+    """
+    positions = {}
+    for index, plugin in enumerate(plugins):
+        positions.setdefault(id(plugin), index)
+
+    indegree = [0] * len(plugins)
+    edges = [[] for _ in plugins]
+    for index, plugin in enumerate(plugins):
+        for requirement in plugin.requirements.values():
+            dependency = requirement.plugin
+            if isinstance(dependency, str):
+                dependency = _PLUGIN_REGISTRY.get(dependency, (None,))[0]
+            position = positions.get(id(dependency))
+            if position is None or position == index:
+                continue
+            edges[position].append(index)
+            indegree[index] += 1
+
+    ready = [index for index, degree in enumerate(indegree) if not degree]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        index = heapq.heappop(ready)
+        order.append(index)
+        for dependent in edges[index]:
+            indegree[dependent] -= 1
+            if not indegree[dependent]:
+                heapq.heappush(ready, dependent)
+
+    if len(order) < len(plugins):
+        ordered = set(order)
+        order.extend(index for index in range(len(plugins)) if index not in ordered)
+
+    return order
+
+
 class PluginGroup(Plugin[list[_R]], MutableSequence[typing.Union[Plugin[_R], str]]):
     """
     This class groups together plugins under certain guarantees:
@@ -39,6 +86,8 @@ class PluginGroup(Plugin[list[_R]], MutableSequence[typing.Union[Plugin[_R], str
 
     """
 
+    __slots__ = ("plugins",)
+
     def __init__(
         self,
         plugin: typing.Callable = void_args,
@@ -65,12 +114,12 @@ class PluginGroup(Plugin[list[_R]], MutableSequence[typing.Union[Plugin[_R], str
 
     def _load_dependencies(self, kwargs):
         ret = {}
-        for dest, plugin in self.dependencies.copy().items():
+        for dest, plugin in tuple(self.dependencies.items()):
             if plugin in self:
                 continue
             if dest in kwargs:
                 continue
-            ret[dest] = plugin.load(conflict_strategy="keep_existing")
+            ret[dest] = self._load_dependency(dest, plugin)
         return ret
 
     def _group_load(self, load_callable, *args, **kwargs) -> list[_R]:
@@ -97,18 +146,23 @@ class PluginGroup(Plugin[list[_R]], MutableSequence[typing.Union[Plugin[_R], str
 
         kwargs.setdefault("safe_args", True)
         kwargs.setdefault("conflict_strategy", "keep_existing")
-        ret = []
+        resolved = []
 
         for plugin in plugins:
             if not isinstance(plugin, Plugin):
                 try:
-                    plugin = lookup_plugin(plugin, import_lookup=self._settings["import_lookup"])
+                    plugin = lookup_plugin(plugin, import_lookup=self._settings.import_lookup)
                 except PluginNotFoundError as err:
                     raise PluginLoadError(f"{self.get_full_name()}: Could not find plugin in group {plugin}") from err
-            instance = plugin.load(*args, **kwargs)
-            if not self.type and self.infer_type:
-                self._set_type_from_instance(instance)
-            ret.append(instance)
+            resolved.append(plugin)
+
+        # load plugins required by other plugins in this group first to avoid reloading them
+        ret = [empty] * len(resolved)
+        for index in _load_order(resolved):
+            ret[index] = resolved[index].load(*args, **kwargs)
+
+        if ret and not self.type and self.infer_type:
+            self._set_type_from_instance(ret[0])
 
         if gen:
             try:
@@ -131,7 +185,7 @@ class PluginGroup(Plugin[list[_R]], MutableSequence[typing.Union[Plugin[_R], str
                 ret = err.value
 
         if ret:
-            if not (isinstance(ret, typing.Sequence) and len(ret) == 2 and isinstance(ret[0], typing.Iterable)):
+            if not (isinstance(ret, typing.Sequence) and len(ret) == 4 and isinstance(ret[0], typing.Iterable)):
                 ret = ret, instance, args, kwargs
             plugins_, instance_, args_, kwargs_ = ret
             plugins, instance, args, kwargs = (
@@ -145,7 +199,7 @@ class PluginGroup(Plugin[list[_R]], MutableSequence[typing.Union[Plugin[_R], str
         for plugin in reversed(plugins):
             if not isinstance(plugin, Plugin):
                 try:
-                    plugin = lookup_plugin(plugin, import_lookup=self._settings["import_lookup"])
+                    plugin = lookup_plugin(plugin, import_lookup=self._settings.import_lookup)
                 except PluginNotFoundError as err:
                     raise PluginUnloadError(f"{self.get_full_name()}: Could not find plugin in group {plugin}") from err
             ret.append(plugin._unload(*args, _unload_dependents=False, **kwargs))
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import sys
+import typing
+from collections import OrderedDict
+
+from pyplugin import base
+from pyplugin.exceptions import PluginRegisterError, PluginNotFoundError
+from pyplugin.utils import import_helper
+from pyplugin.settings import Settings, with_flag, REGISTER_MODE
+
+if typing.TYPE_CHECKING:
+    from pyplugin.base import Plugin, PluginLike
+
+
+_PLUGIN_REGISTRY: dict[str, tuple[Plugin, dict]] = {}
+_REGISTRY_VERSION = 0
+# reverse index of the registry, plugin to the names it is registered under (a dict as an ordered set)
+_PLUGIN_ALIASES: dict[Plugin, dict[str, None]] = {}
+
+
+def register(
+    plugin: PluginLike,
+    name: str = None,
+    conflict_strategy: typing.Literal["replace", "keep_existing", "error"] = "error",
+    transient: bool = False,
+    **kwargs,
+) -> Plugin:
+    """
+    Arguments:
+        plugin (PluginLike): The plugin to register
+        name (str): The name to register the plugin under if not the plugin's full name (default: the plugin's
+            full name)
+        conflict_strategy ("replace" | "keep_existing" | "error"): Handle the case that a different plugin is already
+            registered under the same name:
+
+                - "keep_existing": Ignore the incoming register request
+                - "replace": Unregister the existing plugin first (if it's not loaded).
+                - "error": raises PluginRegisterError
+
+        transient (bool): Calls to register under the same name will behave as if conflict_strategy == "replace".
+    Raises:
+        PluginRegisterError: If there was an error in registering the plugin (e.g. trying to replace an already loaded
+            plugin)
+    Returns:
+        Plugin: The newly registered plugin or the existing plugin if conflict_strategy is "keep_existing"
+    """
+    # TODO: evyn.machi: perhaps in the future we can have a register hook
+    if not isinstance(plugin, base.Plugin):
+        plugin = base.Plugin(plugin, anonymous=True)
+
+    name = sys.intern(name) if name else plugin._full_name
+
+    entry = _PLUGIN_REGISTRY.get(name)
+    if entry is not None and not entry[1].get("transient", False):
+        existing, _ = entry
+        if existing is plugin:
+            return existing
+
+        if conflict_strategy == "keep_existing":
+            return existing
+        elif conflict_strategy == "replace":
+            unregister(name, conflict_strategy="error")
+        elif conflict_strategy == "error":
+            raise PluginRegisterError(f"Plugin with name {name} already registered.")
+
+    # no entry, a transient entry or one just unregistered, it is overwritten in place
+    kwargs.update(transient=transient)
+    _set_entry(name, plugin, kwargs)
+
+    return plugin
+
+
+def unregister(
+    plugin: typing.Union[str, Plugin],
+    conflict_strategy: typing.Literal["ignore", "error"] = "error",
+) -> typing.Optional[Plugin]:
+    """
+
+    Arguments:
+        plugin (Plugin | str): The plugin to unregister
+        conflict_strategy ("ignore" | "error"): Handle the case that the name is not registered.
+
+            - "ignore": Ignore the incoming unregister request
+            - "error": raises PluginRegisterError
+    Raises:
+        PluginRegisterError: If there was an error in unregistering the plugin
+    Returns:
+        Plugin | None: The unregistered plugin or None
+    """
+    name = plugin if isinstance(plugin, str) else plugin._full_name
+
+    # TODO: evyn.machi: perhaps in the future we can have an unregister hook
+    entry = _PLUGIN_REGISTRY.get(name)
+    if entry is None:
+        if conflict_strategy == "ignore":
+            return None
+        elif conflict_strategy == "error":
+            raise PluginRegisterError(f"Plugin {name} is not registered")
+
+    if entry[0].is_loaded():
+        raise PluginRegisterError(f"Cannot unregister already loaded plugin {name}.")
+
+    return _delete_entry(name)
+
+
+def get_registered_plugin(name: str) -> Plugin:
+    """
+    Arguments:
+        name (str): The name of the plugin
+    Returns:
+        Plugin: The plugin registered with the given name
+    Raises:
+        PluginNotFoundError: If the plugin with the given name is not found
+    """
+    entry = _PLUGIN_REGISTRY.get(name)
+    if entry is None:
+        raise PluginNotFoundError(name)
+    return entry[0]
+
+
+# Every change to the registry goes through _set_entry, _delete_entry or _clear_registry, which keep the alias index
+# and the registry version in step with it.
+
+
+def _set_entry(name: str, plugin: Plugin, kwargs: dict):
+    entry = _PLUGIN_REGISTRY.get(name)
+    if entry is not None:
+        _discard_alias(entry[0], name)
+    _PLUGIN_REGISTRY[name] = (plugin, kwargs)
+    _PLUGIN_ALIASES.setdefault(plugin, {})[name] = None
+    _bump_registry_version()
+
+
+def _delete_entry(name: str) -> Plugin:
+    plugin, _ = _PLUGIN_REGISTRY.pop(name)
+    _discard_alias(plugin, name)
+    _bump_registry_version()
+    return plugin
+
+
+def _discard_alias(plugin: Plugin, name: str):
+    aliases = _PLUGIN_ALIASES.get(plugin)
+    if aliases is None:
+        return
+    aliases.pop(name, None)
+    if not aliases:
+        del _PLUGIN_ALIASES[plugin]
+
+
+def _bump_registry_version():
+    global _REGISTRY_VERSION
+    _REGISTRY_VERSION += 1
+
+
+def _clear_registry():
+    """Unregisters every plugin, loaded or not, resetting the alias index along with the registry (e.g. for tests)"""
+    _PLUGIN_REGISTRY.clear()
+    _PLUGIN_ALIASES.clear()
+    _bump_registry_version()
+
+
+def get_registry_version() -> int:
+    """
+    Returns:
+        int: A counter that increases every time a plugin is registered or unregistered. Anything derived from the
+        registry can store it and compare it later to check whether it is still current.
+
+    Note: Only changes made through this module (e.g. :func:`register` and :func:`unregister`) are counted. Editing the
+    registry directly is unsupported, plugins would keep dependencies resolved against the old registry.
+    """
+    return _REGISTRY_VERSION
+
+
+def get_registered_plugins() -> OrderedDict[str, Plugin]:
+    """
+    Returns:
+        OrderedDict[str, Plugin]: A map from plugin name to plugin in the order which they were registered.
+    """
+    return OrderedDict((name, plugin) for name, (plugin, _) in _PLUGIN_REGISTRY.items())
+
+
+def replace_registered_plugin(name: str, plugin: PluginLike, **kwargs):
+    """
+    Will replace the registered plugin with the given name in-place with the given plugin.
+
+    See :meth:`~pyplugin.base.Plugin.replace_with`.
+
+    Arguments:
+        name (str): The plugin name to replace
+        plugin (PluginLike): The plugin to replace the curent plugin with
+        kwargs: See :meth:`~pyplugin.base.Plugin.replace_with`
+    """
+    registered_plugin = get_registered_plugin(name)
+    registered_plugin.replace_with(plugin, **kwargs)
+
+
+def get_aliases(plugin: Plugin) -> list[str]:
+    """
+    Arguments:
+        plugin (Plugin): The plugin to get aliases for
+    Returns:
+        list[str]: A list of names that this plugin is registered to.
+    """
+    return list(_PLUGIN_ALIASES.get(plugin, ()))
+
+
+def lookup_plugin(name: str, import_lookup: bool = None) -> Plugin:
+    """
+    Arguments:
+        name (str): The plugin name to lookup
+        import_lookup (bool): If True and :code:`name` is not registered, will attempt to import the name
+            and wrap in :class:`Plugin`.
+    Returns:
+        Plugin: The plugin with the registered name, falling back to an import lookup that wraps
+    Raises:
+        PluginNotFoundError: If the name is not registered and could not be imported as a callable
+    """
+    entry = _PLUGIN_REGISTRY.get(name)
+    if entry is not None:
+        return entry[0]
+
+    if import_lookup is None:
+        import_lookup = Settings()["import_lookup"]
+    if not import_lookup:
+        raise PluginNotFoundError(name)
+
+    # plugins found through an import are registered transient, so the real definition can still be registered
+    with with_flag(REGISTER_MODE, "transient"):
+        plugin_like = import_helper(name)
+
+        if isinstance(plugin_like, base.Plugin):
+            return plugin_like
+
+        if not callable(plugin_like):
+            raise PluginNotFoundError(name)
+        return base.Plugin(plugin_like, name=name)
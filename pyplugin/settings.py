@@ -29,7 +29,7 @@ IMPORT_LOOKUP = _setting(
     name="import_lookup", type=bool, envvar=f"{_PREFIX}_IMPORT_LOOKUP", values=(True, False), default=True
 )
 """ 
-When using the :func:`~pyplugin.base.lookup_plugin` function, (e.g. in dependency lookups), default
+When using the :func:`~pyplugin.registry.lookup_plugin` function, (e.g. in dependency lookups), default
 to using :code:`importlib` as a fallback to find and register the plugin. 
 """
 
@@ -102,9 +102,16 @@ def with_flag(setting: typing.Union[str, _setting], value: typing.Any):
     finally:
         if old_value is not empty:
             set_flag(setting, old_value)
+        else:
+            unset_flag(setting)
 
 
 class Settings:
+    """
+    A snapshot of the settings, read from the environment (or the given overrides) on construction. Each setting is
+    also available as an attribute, which the load path uses to skip the key check in :code:`__getitem__`.
+    """
+
     __slots__ = tuple(_SETTINGS.keys())
 
     def __init__(self, **kwargs):
@@ -1,9 +1,9 @@
 import functools
 import importlib
-import pkgutil
+import sys
+import types
 import typing
 import inspect
-from collections import OrderedDict
 
 
 empty = object()
@@ -40,9 +40,54 @@ def maybe_decorator(func: typing.Callable):
     return wrapper
 
 
+# dot-delimited name to the module and attribute name it resolved to. Only successful imports are cached and the
+# attribute is read from the module on each call, so names defined later (or by importlib.reload) are still found.
+_IMPORT_CACHE: dict[str, tuple[types.ModuleType, str]] = {}
+
+
+def _cached_import(name: str):
+    """
+    Arguments:
+        name (str): The dot-delimited name to import
+    Returns:
+        Any | empty: The object the name currently resolves to through the cached module, or empty if the name is
+        not cached (a stale entry is dropped)
+    """
+    cached = _IMPORT_CACHE.get(name)
+    if cached is None:
+        return empty
+
+    module, attribute = cached
+    if sys.modules.get(module.__name__) is module:
+        value = getattr(module, attribute, empty) if attribute else module
+        if value is not empty:
+            return value
+    del _IMPORT_CACHE[name]
+    return empty
+
+
+def clear_import_cache():
+    """Clears the modules cached by :func:`import_helper`"""
+    _IMPORT_CACHE.clear()
+
+
 def import_helper(name: str, ignore_missing: bool = True):
-    *module, name = name.split(".")
-    module = ".".join(module)
+    """
+    Imports the dot-delimited name, whether it is a module or an attribute of a module. The module a name resolved to
+    is cached, misses are not. Use :func:`clear_import_cache` to reset.
+
+    Arguments:
+        name (str): The dot-delimited name to import
+        ignore_missing (bool): If True, returns None instead of raising if the name could not be imported
+    Returns:
+        Any | None: The imported object
+    """
+    value = _cached_import(name)
+    if value is not empty:
+        return value
+
+    full_name = name
+    module, _, name = name.rpartition(".")
     if not module:
         module, name = name, ""
 
@@ -55,25 +100,24 @@ def import_helper(name: str, ignore_missing: bool = True):
             return None
 
     if not name:
+        _IMPORT_CACHE[full_name] = (module, name)
         return module
 
-    if hasattr(module, "__path__"):
-        for loader, module_name, is_pkg in pkgutil.walk_packages(module.__path__):
-            if module_name != name:
-                continue
-            try:
-                submodule = loader.find_module(module_name).load_module(module_name)
-            except ImportError:
-                continue
-            setattr(module, module_name, submodule)
+    if hasattr(module, "__path__") and not hasattr(module, name):
+        try:
+            importlib.import_module(f"{module.__name__}.{name}")
+        except ImportError:
+            pass
 
     try:
-        return getattr(module, name)
+        value = getattr(module, name)
     except AttributeError:
         if not ignore_missing:
             raise
         else:
             return None
+    _IMPORT_CACHE[full_name] = (module, name)
+    return value
 
 
 def void_no_args():
@@ -121,8 +165,8 @@ def make_safe_args(func: typing.Callable, args=(), kwargs=None, default_args=(),
     default_args = list(default_args) if default_args else []
     default_kwargs = default_kwargs if default_kwargs else {}
 
-    param_args = OrderedDict({})
-    param_kwargs = OrderedDict({})
+    param_args = {}
+    param_kwargs = {}
 
     is_partial = isinstance(func, functools.partial)
     orig_func = func
@@ -155,7 +199,7 @@ def make_safe_args(func: typing.Callable, args=(), kwargs=None, default_args=(),
             param_args[param] = default_args[0]
             default_args = default_args[1:]
 
-    args_, kwargs_ = list(param_args.values()), param_kwargs.copy()
+    args_, kwargs_ = list(param_args.values()), param_kwargs
 
     # Append extra arguments for varargs and varkwargs
     if argspec.varargs:
@@ -1,6 +1,11 @@
+import os
+
 import pytest
 
-from pyplugin import plugin
+from pyplugin import Plugin, plugin, register, unregister, get_registered_plugin, get_registry_version
+from pyplugin.base import PluginRequirement, get_aliases, lookup_plugin
+from pyplugin.exceptions import CircularDependencyError, PluginNotFoundError
+from pyplugin.settings import REGISTER_MODE, with_flag, unset_flag, set_flag
 
 
 @plugin
@@ -56,3 +61,321 @@ def test_callback():
     returns_1.add_callback(lambda instance: instance + 1)
 
     assert returns_1() == 2
+
+
+def test_reload_all_dependents():
+    @plugin(anonymous=True)
+    def source(arg=1):
+        return arg
+
+    @plugin(anonymous=True, requires=source)
+    def first(source):
+        return source
+
+    @plugin(anonymous=True, requires=source)
+    def second(source):
+        return source
+
+    assert first() == second() == 1
+    assert first in source.dependents and second in source.dependents
+
+    answer = 2
+    source(arg=answer)
+
+    assert first.instance == second.instance == answer
+
+
+def test_register_same_plugin():
+    @plugin
+    def registered_once():
+        return 1
+
+    assert register(registered_once) is registered_once
+
+
+def test_aliases():
+    @plugin
+    def aliased():
+        return 1
+
+    register(aliased, name="tests.aliased_again")
+    assert aliased.is_registered(name="tests.aliased_again")
+    assert set(get_aliases(aliased)) == {aliased.full_name, "tests.aliased_again"}
+
+    unregister("tests.aliased_again")
+    assert get_aliases(aliased) == [aliased.full_name]
+    assert not aliased.is_registered(name="tests.aliased_again")
+
+
+def imported_helper():
+    return 1
+
+
+def test_register_over_import_lookup():
+    name = "tests.test_example.imported_helper"
+    looked_up = lookup_plugin(name)
+    assert looked_up.is_registered(name=name)
+
+    @plugin(anonymous=True)
+    def replacement():
+        return 2
+
+    version = get_registry_version()
+    assert register(replacement, name=name) is replacement
+    assert lookup_plugin(name) is replacement
+    assert get_registry_version() > version
+    assert get_aliases(looked_up) == []
+    unregister(name)
+
+
+def test_import_lookup_after_definition():
+    name = "tests.test_example.defined_later"
+    with pytest.raises(PluginNotFoundError):
+        lookup_plugin(name)
+
+    def defined_later():
+        return 1
+
+    globals()["defined_later"] = defined_later
+    try:
+        assert lookup_plugin(name).is_registered(name=name)
+    finally:
+        del globals()["defined_later"]
+        unregister(name)
+
+
+def test_registry_version():
+    version = get_registry_version()
+
+    @plugin
+    def versioned():
+        return 1
+
+    assert get_registry_version() > version
+
+    version = get_registry_version()
+    unregister(versioned)
+    assert get_registry_version() > version
+
+
+def test_lazy_requirement():
+    @plugin(anonymous=True)
+    def expensive():
+        return 1
+
+    @plugin(anonymous=True, requires=PluginRequirement(expensive, "expensive", lazy=True))
+    def uses_expensive(expensive, use=False):
+        return expensive() if use else 0
+
+    assert uses_expensive() == 0
+    assert not expensive.is_loaded()
+
+    assert uses_expensive(use=True) == 1
+    assert expensive.is_loaded()
+    assert uses_expensive in expensive.dependents
+
+
+def test_reload_transitive_dependents():
+    calls = []
+
+    @plugin(anonymous=True)
+    def root(arg=1):
+        return arg
+
+    @plugin(anonymous=True, requires=root)
+    def middle(root):
+        calls.append("middle")
+        return root
+
+    @plugin(anonymous=True, requires=[root, middle])
+    def leaf(root, middle):
+        calls.append("leaf")
+        return root, middle
+
+    assert leaf() == (1, 1)
+    calls.clear()
+
+    answer = 2
+    root(arg=answer)
+
+    assert middle.instance == answer
+    assert leaf.instance == (answer, answer)
+    assert calls == ["middle", "leaf"]
+
+
+def test_shared_and_circular_requirements():
+    @plugin(anonymous=True)
+    def base():
+        return 1
+
+    @plugin(anonymous=True, requires=base)
+    def left(base):
+        return base
+
+    @plugin(anonymous=True, requires=base)
+    def right(base):
+        return base
+
+    @plugin(anonymous=True, requires=[left, right])
+    def top(left, right):
+        return left + right
+
+    assert top() == 2
+    assert set(base.dependents) == {left, right}
+
+    top.unload()
+    base.unload()
+    base.add_requirement(top)
+    with pytest.raises(CircularDependencyError, match="-->"):
+        top()
+
+
+def test_requirement_follows_registry():
+    register(lambda: 1, name="tests.swappable")
+
+    @plugin(anonymous=True, requires="tests.swappable")
+    def uses_swappable(swappable):
+        return swappable
+
+    assert uses_swappable() == 1
+    uses_swappable.unload()
+    get_registered_plugin("tests.swappable").unload()
+    unregister("tests.swappable")
+
+    register(lambda: 2, name="tests.swappable")
+    assert uses_swappable() == 2
+
+
+def test_with_flag_restores_unset():
+    old_value = unset_flag(REGISTER_MODE.name)
+    try:
+        with with_flag(REGISTER_MODE, "transient"):
+            assert os.environ[REGISTER_MODE.envvar] == "transient"
+        assert REGISTER_MODE.envvar not in os.environ
+    finally:
+        if old_value is not None:
+            set_flag(REGISTER_MODE, old_value)
+
+
+def test_unload_transitive_dependents():
+    calls = []
+
+    @plugin(anonymous=True, unload_callable=lambda _: calls.append("root"))
+    def root():
+        return 1
+
+    @plugin(anonymous=True, requires=root, unload_callable=lambda _: calls.append("middle"))
+    def middle(root):
+        return root
+
+    @plugin(anonymous=True, requires=[root, middle], unload_callable=lambda _: calls.append("leaf"))
+    def leaf(root, middle):
+        return root, middle
+
+    leaf()
+    root.unload()
+
+    assert not leaf.is_loaded() and not middle.is_loaded()
+    assert calls == ["leaf", "middle", "root"]
+
+
+def test_replace_with_same_callables():
+    calls = []
+
+    @plugin(anonymous=True)
+    def replaced():
+        calls.append("load")
+        return 1
+
+    replaced()
+    replaced.replace_with(replaced.copy())
+
+    assert replaced.is_loaded()
+    assert calls == ["load"]
+
+
+def test_replace_with_bind():
+    def original(plugin=None):
+        return "original", plugin
+
+    def bound(plugin=None):
+        return "bound", plugin
+
+    replaced = Plugin(original, anonymous=True)
+    replaced()
+
+    replaced.replace_with(Plugin(bound, bind=True, anonymous=True))
+    assert replaced.instance == ("bound", replaced)
+
+    replaced.replace_with(Plugin(bound, bind=False, anonymous=True))
+    assert replaced.instance == ("bound", None)
+
+
+def test_requirement_added_during_load():
+    @plugin(anonymous=True)
+    def added():
+        return 1
+
+    @plugin(anonymous=True)
+    def later(**kwargs):
+        return kwargs
+
+    @plugin(anonymous=True)
+    def first():
+        later.add_requirement(added)
+        return 1
+
+    @plugin(anonymous=True, requires=[first, later])
+    def top(**kwargs):
+        return kwargs
+
+    top()
+    assert later.instance == {added.name: 1}
+
+
+def test_copy():
+    @plugin(anonymous=True, requires=upstream)
+    def original(**kwargs):
+        return kwargs
+
+    copied = original.copy("copied")
+    assert copied.name == "copied" and not copied.is_loaded()
+    assert copied.requirements == original.requirements and copied.requirements is not original.requirements
+
+    for slot in type(original).__slots__:
+        if slot != "__weakref__":
+            getattr(copied, slot)
+
+    copied._settings.merge({"enforce_type": True})
+    assert copied._settings is not original._settings
+    assert original._settings.enforce_type != copied._settings.enforce_type
+
+
+def test_reload_diamond_dependents_once():
+    calls = []
+
+    @plugin(anonymous=True)
+    def shared():
+        calls.append("shared")
+        return 1
+
+    @plugin(anonymous=True, requires=shared)
+    def middle(**kwargs):
+        calls.append("middle")
+        return kwargs
+
+    @plugin(anonymous=True, requires=[shared, middle])
+    def top(**kwargs):
+        calls.append("top")
+        return kwargs
+
+    top()
+    calls.clear()
+    shared.load(conflict_strategy="force")
+    assert calls == ["shared", "middle", "top"]
+
+    # unloaded on its own, its dependents are still loaded when it loads again
+    shared._unload(_unload_dependents=False)
+    calls.clear()
+    shared.load()
+    assert calls == ["shared", "middle", "top"]
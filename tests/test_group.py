@@ -60,3 +60,65 @@ def test_group_reqs():
         return my_group
 
     assert downstream() == [(1, {"upstream": "answer"}), (2, {"upstream": "answer"})]
+
+
+def test_group_unload_yield():
+    state = MagicMock()
+
+    @plugin(anonymous=True)
+    def member():
+        return 1
+
+    def unloader(plugins, instances, *args, **kwargs):
+        state(instances)
+        yield plugins, instances, args, kwargs
+
+    my_group_ = PluginGroup(name="unload_group", unload_callable=unloader, plugins=[member], anonymous=True)
+
+    assert my_group_() == [1]
+    my_group_.unload()
+
+    assert not member.is_loaded()
+    assert state.call_args_list == [call([1])]
+
+
+def test_group_load_order():
+    state = MagicMock()
+
+    @plugin(anonymous=True)
+    def base(arg=0):
+        state("base")
+        return arg
+
+    @plugin(anonymous=True, requires=base)
+    def derived(base, arg=0):
+        state("derived")
+        return base + 1
+
+    @group(anonymous=True, plugins=[derived, base])
+    def ordered_group(plugins):
+        yield plugins, (), {"arg": 1, "conflict_strategy": "replace"}
+
+    assert ordered_group() == [2, 1]
+    assert state.call_args_list == [call("base"), call("derived")]
+
+
+def test_keep_existing_reloads_group_unloaded_dependency():
+    @plugin
+    def member():
+        return 1
+
+    @plugin(requires=member)
+    def user(member):
+        return member + 1
+
+    members = PluginGroup(name="members")
+    members.append(member)
+
+    user()
+    members()
+    members.unload()
+    assert user.is_loaded() and not member.is_loaded()
+
+    user.load(conflict_strategy="keep_existing")
+    assert member.is_loaded()
@@ -10,7 +10,7 @@ from hypothesis.stateful import (
 )
 
 from pyplugin import Plugin, PluginGroup
-from pyplugin.base import _PLUGIN_REGISTRY
+from pyplugin.registry import _PLUGIN_REGISTRY, _clear_registry
 from pyplugin.exceptions import CircularDependencyError
 
 from tests.strategies import function_and_call
@@ -124,7 +124,7 @@ class PluginStateMachine(RuleBasedStateMachine):
         return multiple()
 
     def teardown(self):
-        _PLUGIN_REGISTRY.clear()
+        _clear_registry()
 
 
 TestPluginStateMachine = PluginStateMachine.TestCase